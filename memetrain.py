@@ -1,5 +1,4 @@
-from shapely.geometry import Point, Polygon
-from collections import Counter
+from collections import Counter, deque
 import pygame_menu
 import logging
 import pygame
@@ -12,7 +11,7 @@ import os
 
 
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format="[%(asctime)s] %(levelname)s %(message)s",
     datefmt="%H:%M:%S"
 )
@@ -23,28 +22,90 @@ logger = logging.getLogger(__name__)
 current_path = os.path.dirname(os.path.abspath(__file__))
 ASSETS_PATH = os.path.join(current_path, 'assets')
 MEMES_PATH = os.path.join(ASSETS_PATH, 'memes')
+SOUND_DIR = os.path.join(ASSETS_PATH, 'sound')
+_SOUND_FILES = frozenset(os.listdir(SOUND_DIR))
 MEMES = [os.path.join(ASSETS_PATH, 'memes', x) for x in os.listdir(MEMES_PATH)]
 DRIVERS = json.load(open(os.path.join(ASSETS_PATH, 'drivers.json'), 'r'))
 TEAMS = {x['driver']: x['team'] for x in DRIVERS['drivers']}
+# (path, driver name, team) for every meme, plus meme indices grouped by driver
+MEME_INFO: list[tuple[str, str, str | None]] = []
+MEMES_BY_DRIVER: dict[str, list[int]] = {}
+for meme_path in MEMES:
+    driver_name = re.sub(r'[0-9]', '', os.path.splitext(os.path.basename(meme_path))[0])
+    MEMES_BY_DRIVER.setdefault(driver_name, []).append(len(MEME_INFO))
+    MEME_INFO.append((meme_path, driver_name, TEAMS.get(driver_name, None)))
+# Memes kept back from the first spawn, so the game doesn't open in super-max
+VERSTAPPEN_EXCLUDE = frozenset(MEME_INFO[i][0] for i in MEMES_BY_DRIVER['verstappen'])
 WIDTH, HEIGHT = 1200, 800
 GRID_SIZE = 60
 MEME_WIDTH = 150
+# Maps a grid direction to the rotation angle (in degrees) of a car facing it
+_DIR_TO_ANGLE: dict[tuple[int, int], int] = {
+    (0, -1): 0,   # Up
+    (0, 1): 180,  # Down
+    (-1, 0): 90,  # Left
+    (1, 0): 270   # Right
+}
+
+# Loaded (and scaled) surfaces, keyed by (path, size, alpha); surfaces scaled
+# to a width are keyed by (path, ('w', width), alpha)
+_SURF_CACHE: dict[
+    tuple[str, tuple[int, int] | tuple[str, int] | None, bool], pygame.Surface
+] = {}
+
+
+def load_scaled(
+        path: str,
+        size: tuple[int, int] | None = None,
+        alpha: bool = True,
+    ) -> pygame.Surface:
+    """
+    Load an image, optionally scaled to the given size, caching the result.
+    The surface is converted to the display format, keeping per-pixel alpha
+    unless alpha is False (for opaque images). The display mode must be set
+    before calling this.
+    """
+    key = (path, size, alpha)
+    surface = _SURF_CACHE.get(key)
+    if surface is None:
+        surface = pygame.image.load(path)
+        if size:
+            surface = pygame.transform.scale(surface, size)
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        _SURF_CACHE[key] = surface
+    return surface
+
+
+def load_scaled_to_width(path: str, width: int, alpha: bool = True) -> pygame.Surface:
+    """
+    Load an image scaled to the given width, preserving the aspect ratio.
+    Only the scaled surface is cached; the full size image is discarded.
+    """
+    key = (path, ('w', width), alpha)
+    surface = _SURF_CACHE.get(key)
+    if surface is None:
+        image = pygame.image.load(path)
+        orig_width, orig_height = image.get_size()
+        aspect_ratio = orig_width / orig_height
+        surface = pygame.transform.scale(image, (width, int(width / aspect_ratio)))
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        _SURF_CACHE[key] = surface
+    return surface
 
 
 class Meme(pygame.sprite.Sprite):
     """
     The Meme class, for handling the meme in the meme game about meme trains.
 
+    The meme is picked on construction and put on the grid with ``place``, so its
+    size is known before a position is chosen.
+
     Parameters
     ----------
-    x : int
-        The x position of the meme.
-    y : int
-        The y position of the meme.
     width : int
         The width of the meme.
-    exclude_image : list[str] | None
-        A list of images to exclude from the list of memes. 
+    exclude_image : frozenset[str] | list[str] | str | None
+        An image, or a collection of images, to exclude from the list of memes. 
         This is useful when you want to exclude an image that has already been used for the previous meme.
 
     Attributes
@@ -59,75 +120,67 @@ class Meme(pygame.sprite.Sprite):
         The path to the meme image.
     driver_name : str
         The name of the driver.
-    team : str
-        The team of the driver.
+    team : str | None
+        The team of the driver, or None if the driver isn't in drivers.json.
     image : pygame.Surface
         The pygame image object.
+    cols, rows : int
+        The number of grid cells covered by the meme's collision box.
     position : tuple[int, int]
-        The position of the meme.
-    meme_box : shapely.geometry.Polygon
-        The outline of the meme.
+        The pixel position of the meme.
+    rect : pygame.Rect
+        The area of the screen covered by the meme.
+    x0, y0, x1, y1 : int
+        The pixel edges of the meme (left, top, right, bottom).
     """
     def __init__(
             self, 
-            x: int,
-            y: int,
             width: int,
-            exclude_image: list[str] | None = None,
+            exclude_image: frozenset[str] | list[str] | str | None = None,
         ) -> None:
         super().__init__()
         self.width = width
+        exclude = {exclude_image} if isinstance(exclude_image, str) else exclude_image or ()
+        # Rejection sample rather than building a filtered copy of MEME_INFO
+        while True:
+            meme_info = MEME_INFO[random.randrange(len(MEME_INFO))]
+            if meme_info[0] not in exclude:
+                break
+        self.meme_image, self.driver_name, self.team = meme_info
+
+        # Loaded on first use, then served from the cache
+        self.image = load_scaled_to_width(self.meme_image, width)
+        self.height = self.image.get_height()
+        # Cells whose top-left corner falls inside the (inclusive) collision box
+        self.cols = self.width // GRID_SIZE + 1
+        self.rows = self.height // GRID_SIZE + 1
+        logger.debug("Loaded meme: %s", self.meme_image)
+        logger.debug("Driver: %s", self.driver_name)
+        logger.debug("Team: %s", self.team)
+        logger.debug("Width: %s; Height: %s", self.width, self.height)
+
+    def place(self, x: int, y: int) -> None:
+        """
+        Put the meme at the given grid position.
+        """
         self.x, self.y = x, y
-        if exclude_image is not None:
-            self.meme_image = random.choice([x for x in MEMES if x not in exclude_image])
-        else:
-            self.meme_image = random.choice(MEMES)
-
-        self.driver_name = re.sub(
-            r'[0-9]', 
-            '', 
-            os.path.basename(self.meme_image.replace('.png', ''))
-        )
-        self.team = TEAMS.get(self.driver_name, None)
+        self.position = (x * GRID_SIZE, y * GRID_SIZE)
+        self.rect = pygame.Rect(self.position, (self.width, self.height))
 
-        self.image = pygame.image.load(self.meme_image)
-        
-        # Scale the image
-        orig_width, orig_height = self.image.get_size()
-        aspect_ratio = orig_width / orig_height
-        self.width = width
-        self.height = int(width / aspect_ratio)
-        self.image = pygame.transform.scale(self.image, (self.width, self.height))
-        logger.debug(f"Loaded meme: {self.meme_image}")
-        logger.debug(f"Driver: {self.driver_name}") 
-        logger.debug(f"Team: {self.team}")
-        logger.debug(f"Width: {self.width}; Height: {self.height}")
-        logger.debug(f"Position: {self.position}")
-        logger.debug(f"Edges: {self.meme_box.exterior.coords.xy}")
-        
-    @property
-    def position(self) -> tuple[int, int]:
-        return (self.x * GRID_SIZE, self.y * GRID_SIZE)
-    
-    @property
-    def meme_box(self) -> Polygon:
-        x, y, width, height = self.x  * GRID_SIZE, self.y * GRID_SIZE, self.width, self.height
-        return Polygon(
-            [
-                (x, y), 
-                (x + width, y), 
-                (x + width, y + height), 
-                (x, y + height), 
-                (x, y)
-            ]
-        )
-            
+        # Pixel edges of the meme, used for collision checks
+        self.x0, self.y0 = self.position
+        self.x1, self.y1 = self.x0 + self.width, self.y0 + self.height
+        logger.debug("Position: %s", self.position)
+        logger.debug("Edges: %s", (self.x0, self.y0, self.x1, self.y1))
 
 
 class MemeTrain:
     """
     The MemeTrain class, for handling the meme train game.
     """
+    # (label, snake speed) options for the menu's speed selector
+    _difficulty_choices = (('Haas', 4), ('McLaren', 7), ('Red Bull', 9))
+
     def __init__(self, fullscreen: bool = True):
         pygame.init()
         pygame.mixer.init()
@@ -141,50 +194,76 @@ class MemeTrain:
         # Setup the grid
         self.grid_width = self.screen_width // GRID_SIZE
         self.grid_height = self.screen_height // GRID_SIZE
-        logger.debug(f"Grid width: {self.grid_width}; Grid height: {self.grid_height}")
+        logger.debug("Grid width: %s; Grid height: %s", self.grid_width, self.grid_height)
         pygame.display.set_caption("Choo choo...all aboard the meme train.")
         self.clock = pygame.time.Clock()
         self.running = False
 
+        self._all_teams: frozenset[str] = frozenset(TEAMS.values())
+
+        # Load the car images up front so nothing is decoded mid-game
+        self.car_surfaces: dict[str, pygame.Surface] = {
+            team: load_scaled(os.path.join(ASSETS_PATH, 'cars', f'{team}.png'), (20, 50))
+            for team in self._all_teams
+        }
+        self.safetycar_surface = load_scaled(os.path.join(ASSETS_PATH, 'cars', 'safetycar.png'), (20, 50))
+        # Every car rotated to each heading, with the offset that centres it in a grid cell
+        self.car_rotations: dict[pygame.Surface, dict[int, tuple[pygame.Surface, tuple[int, int]]]] = {}
+        for surface in [self.safetycar_surface, *self.car_surfaces.values()]:
+            self.car_rotations[surface] = {}
+            for angle in (0, 90, 180, 270):
+                rotated = pygame.transform.rotate(surface, angle)
+                width, height = rotated.get_size()
+                offset = ((GRID_SIZE - width) // 2, (GRID_SIZE - height) // 2)
+                self.car_rotations[surface][angle] = (rotated, offset)
+
         # Initialize snake
-        self.snake = [(self.grid_width // 2, self.grid_height // 2)]
-        self.snake_images = [
-            pygame.transform.scale(
-                pygame.image.load(os.path.join(ASSETS_PATH, 'cars', 'safetycar.png')),
-                (20, 50)
-            )
-        ]
-        self.snake_direction = (0, 1)
+        self._reset_snake()
         self.snake_speed = 4
-        
 
-        # Initialize a meme
-        x, y = self.random_grid_position()
-        while x == self.snake[0][0] and y == self.snake[0][1]:
-            x, y = self.random_grid_position()
-        self.meme = Meme(
-            x=x,
-            y=y,
-            width=MEME_WIDTH,
-            exclude_image=[
-                os.path.join(ASSETS_PATH, 'memes', x) for x in [
-                    'verstappen1.png',
-                    'verstappen2.png',
-                    'verstappen3.png',
-                    'verstappen4.png',
-                ]
-            ]
+        # Only the areas drawn last frame are cleared and pushed to the display
+        self.background_image = load_scaled(
+            os.path.join(ASSETS_PATH, 'Netherlands.png'),
+            (self.screen_width, self.screen_height),
+            alpha=False
         )
-        logger.debug(f"Snake: {self.snake}")
-        logger.debug(f"Meme: {self.meme.driver_name}")
-        logger.debug(f"Snake direction: {self.snake_direction}")
+        self._prev_rects: list[pygame.Rect] = []
+        self._drawn_super_max: bool | None = None
+
+        # End of game images, loaded now so crashing or winning doesn't decode them
+        self.crash_image = load_scaled_to_width(os.path.join(ASSETS_PATH, 'memes', 'toto2.png'), 500)
+        self.win_image = load_scaled_to_width(os.path.join(ASSETS_PATH, 'win.jpg'), 500, alpha=False)
+
+        # Initialize a meme
+        self.meme = Meme(width=MEME_WIDTH, exclude_image=VERSTAPPEN_EXCLUDE)
+        self.meme.place(*self.random_free_grid_position(self.meme.cols, self.meme.rows))
+        logger.debug("Snake: %s", self.snake)
+        logger.debug("Meme: %s", self.meme.driver_name)
+        logger.debug("Snake direction: %s", self.snake_direction)
 
         # Initialize sounds
         self.super_max = False
-        self.super_max_sound = pygame.mixer.Sound(os.path.join(ASSETS_PATH, 'sound', 'super-max.mp3'))
-        self.menu_sound = pygame.mixer.Sound(os.path.join(ASSETS_PATH, 'sound', 'menu.mp3'))
+        self.super_max_sound = pygame.mixer.Sound(os.path.join(SOUND_DIR, 'super-max.mp3'))
+        self.menu_sound = pygame.mixer.Sound(os.path.join(SOUND_DIR, 'menu.mp3'))
         self.meme_sound = None
-        self.teams_collected = []
+        # Driver sounds are decoded the first time they play; drivers without
+        # one fall back to the team radio
+        self.radio_sound = pygame.mixer.Sound(os.path.join(SOUND_DIR, 'f1-radio.mp3'))
+        self.meme_sounds: dict[str, pygame.mixer.Sound] = {}
+        self.exit_sound = pygame.mixer.Sound(os.path.join(SOUND_DIR, 'exit.mp3'))
+        self.win_sound = pygame.mixer.Sound(os.path.join(SOUND_DIR, 'win.mp3'))
+
+        # Pre-render the end of game text
+        self._endgame_font = pygame.font.Font(pygame_menu.font.FONT_BEBAS, 36)
+        self._text_surfs: dict[str, pygame.Surface] = {
+            key: self._endgame_font.render(text, 1, (255, 0, 0))
+            for key, text in [
+                ('crash', "No Mikey! No!"),
+                ('win', "You collected all the things!  Nice!"),
+                ('exit', "Press space key to exit"),
+            ]
+        }
+        self.team_counts: Counter[str] = Counter()
         
         # Setup the menu
         menu_theme = pygame_menu.themes.Theme(
@@ -204,15 +283,21 @@ class MemeTrain:
             theme=menu_theme
         )
         self.setup_menu()
+        self._play_menu_music()
         self.menu.mainloop(self.screen)
 
     def setup_menu(self) -> None:
         """
         Add the menu items to the menu.
         """
-        self.menu.add.selector('Speed :', [('Haas', 4), ('McLaren', 7), ('Red Bull', 9)], onchange=self.set_difficulty)
+        self.menu.add.selector('Speed :', list(self._difficulty_choices), onchange=self.set_difficulty)
         self.menu.add.button('Play', self.start_game)
         self.menu.add.button('Quit', pygame_menu.events.EXIT)
+
+    def _play_menu_music(self) -> None:
+        """
+        Play the menu music.
+        """
         self.menu_sound.play()
     
     def set_difficulty(self, value, difficulty):
@@ -220,7 +305,19 @@ class MemeTrain:
         Set the difficulty of the game.
         """
         self.snake_speed = difficulty
-        logger.debug(f"Difficulty set to {difficulty}")
+        logger.debug("Difficulty set to %s", difficulty)
+
+    def _reset_snake(self) -> None:
+        """
+        Put a lone safety car back in the middle of the grid, heading down.
+        """
+        self.snake_direction = (0, 1)
+        self.snake = deque([(self.grid_width // 2, self.grid_height // 2)])
+        # The angle each segment faces, kept alongside the snake
+        self.snake_angles = deque([_DIR_TO_ANGLE[self.snake_direction]])
+        self.snake_set = set(self.snake)
+        self.self_collision = False
+        self.snake_images = [self.safetycar_surface]
 
     def start_game(self) -> None:
         """
@@ -230,15 +327,11 @@ class MemeTrain:
         self.menu_sound.stop()
         self.run_meme_sound()
 
-        self.snake = [(self.grid_width // 2, self.grid_height // 2)]
-        self.snake_images = [
-            pygame.transform.scale(
-                pygame.image.load(os.path.join(ASSETS_PATH, 'cars', 'safetycar.png')),
-                (20, 50)
-            )
-        ]
-        self.teams_collected = []
-        self.snake_direction = (0, 1)
+        self._reset_snake()
+        self.team_counts = Counter()
+        # Force a full redraw over whatever the menu left on screen
+        self._prev_rects = []
+        self._drawn_super_max = None
 
         # Disable menu
         self.menu.disable()
@@ -255,19 +348,23 @@ class MemeTrain:
         self.super_max_sound.stop()
         self.running = False
         self.menu.enable()
-        self.menu_sound.play()
+        self._play_menu_music()
 
     def handle_events(self):
         """
         Handle input events.
         """
-        for event in pygame.event.get():
+        # Only QUIT and KEYDOWN matter in-game; drop everything else
+        # (e.g. mouse motion) without pumping the queue a second time
+        events = pygame.event.get((pygame.QUIT, pygame.KEYDOWN))
+        pygame.event.clear(pump=False)
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 pygame.quit()
                 sys.exit(0)
             elif event.type == pygame.KEYDOWN:
-                logger.debug(f"Key pressed: {event.key}")
+                logger.debug("Key pressed: %s", event.key)
                 if event.key == pygame.K_ESCAPE:
                     self.exit_to_menu()
                 elif event.key == pygame.K_UP and self.snake_direction != (0, 1):
@@ -283,64 +380,83 @@ class MemeTrain:
         """
         Get the rotation of the snake head.
         """
-        # Maps direction to rotation angle (in degrees)
-        direction_to_angle = {
-            (0, -1): 0,   # Up
-            (0, 1): 180,  # Down
-            (-1, 0): 90,  # Left
-            (1, 0): 270   # Right
-        }
-        return direction_to_angle[self.snake_direction]
+        return _DIR_TO_ANGLE[self.snake_direction]
     
     def random_grid_position(self):
         """
         Get a random grid position - excluding the edges.
         """
         return (random.randint(2, self.grid_width - 3), random.randint(2, self.grid_height - 3))
+
+    def random_free_grid_position(self, cols: int = 1, rows: int = 1):
+        """
+        Get a random grid position for something covering cols x rows cells,
+        none of which are occupied by the snake or are the cell the head
+        moves into next.
+        """
+        hx, hy = self.snake[0]
+        blocked = self.snake_set | {(
+            (hx + self.snake_direction[0]) % self.grid_width,
+            (hy + self.snake_direction[1]) % self.grid_height
+        )}
+
+        def is_free(x, y):
+            return blocked.isdisjoint(
+                (cx, cy) for cx in range(x, x + cols) for cy in range(y, y + rows)
+            )
+
+        # Rejection sampling is quick while the board is mostly empty...
+        for _ in range(8):
+            x, y = self.random_grid_position()
+            if is_free(x, y):
+                return x, y
+        # ...but once it is crowded, pick straight from the free positions
+        free_cells = [
+            (x, y)
+            for x in range(2, self.grid_width - 2)
+            for y in range(2, self.grid_height - 2)
+            if is_free(x, y)
+        ]
+        if not free_cells and (cols, rows) != (1, 1):
+            # Nowhere fits the whole footprint, so settle for a free top-left cell
+            return self.random_free_grid_position()
+        return random.choice(free_cells)
     
     def meme_collision(self):
         """
         Check for collisions with the meme.
         """
-        return self.meme.meme_box.intersects(
-            Point((self.snake[0][0] * GRID_SIZE, self.snake[0][1] * GRID_SIZE))
-        )
+        hx, hy = self.snake[0]
+        px, py = hx * GRID_SIZE, hy * GRID_SIZE
+        m = self.meme
+        return m.x0 <= px <= m.x1 and m.y0 <= py <= m.y1
     
     def snake_collision(self):
         """
         Handle collisions with the snake.
         """
         # Check for collisions with itself (including the head)
-        logger.debug(f"Snake: {self.snake}")
-        if len(self.snake) != len(set(self.snake)):
+        logger.debug("Snake: %s", self.snake)
+        if self.self_collision:
             logger.debug("Snake collided with itself")
             self.meme_sound.stop()
             self.super_max_sound.stop()
             
-            exit_sound = pygame.mixer.Sound(os.path.join(ASSETS_PATH, 'sound', 'exit.mp3'))
-            exit_sound.play()
+            self.exit_sound.play()
 
-            crash_image = pygame.image.load(os.path.join(ASSETS_PATH, 'memes', 'toto2.png'))
-            orig_width, orig_height = crash_image.get_size()
-            aspect_ratio = orig_width / orig_height
-            crash_image = pygame.transform.scale(crash_image, (500, int(500 / aspect_ratio)))
+            crash_image = self.crash_image
             crash_image_rect = crash_image.get_rect(center=(self.screen_width/2, self.screen_height/2))
 
-            font = pygame.font.Font(pygame_menu.font.FONT_BEBAS, 36)
-            text1 = font.render("No Mikey! No!", 1, (255, 0, 0))
+            text1 = self._text_surfs['crash']
             text1_rect = text1.get_rect(center=(self.screen_width/2, self.screen_height/2 + crash_image_rect.height / 2 + 20))
-            text1_surface = pygame.Surface(text1.get_size())
-            text1_surface.fill((0, 0, 0))
 
-            text2 = font.render("Press space key to exit", 1, (255, 0, 0))
+            text2 = self._text_surfs['exit']
             text2_rect = text2.get_rect(center=(self.screen_width/2, text1_rect.bottom + 20))
-            text2_surface = pygame.Surface(text2.get_size())
-            text2_surface.fill((0, 0, 0))
             
             # Blit the image and texts
             self.screen.blit(crash_image, crash_image_rect)
-            self.screen.blit(text1_surface, text1_rect)
-            self.screen.blit(text2_surface, text2_rect)
+            pygame.draw.rect(self.screen, (0, 0, 0), text1_rect)
+            pygame.draw.rect(self.screen, (0, 0, 0), text2_rect)
             self.screen.blit(text1, text1_rect)
             self.screen.blit(text2, text2_rect)
 
@@ -357,30 +473,21 @@ class MemeTrain:
         self.meme_sound.stop()
         self.super_max_sound.stop()
 
-        win_sound = pygame.mixer.Sound(os.path.join(ASSETS_PATH, 'sound', 'win.mp3'))
-        win_sound.play()
+        self.win_sound.play()
 
-        win_image = pygame.image.load(os.path.join(ASSETS_PATH, 'win.jpg'))
-        orig_width, orig_height = win_image.get_size()
-        aspect_ratio = orig_width / orig_height
-        win_image = pygame.transform.scale(win_image, (500, int(500 / aspect_ratio)))
+        win_image = self.win_image
         win_image_rect = win_image.get_rect(center=(self.screen_width/2, self.screen_height/2))
         
-        font = pygame.font.Font(pygame_menu.font.FONT_BEBAS, 36)
-        text1 = font.render("You collected all the things!  Nice!", 1, (255, 0, 0))
+        text1 = self._text_surfs['win']
         text1_rect = text1.get_rect(center=(self.screen_width/2, self.screen_height/2 + win_image_rect.height / 2 + 20))
-        text1_surface = pygame.Surface(text1.get_size())
-        text1_surface.fill((0, 0, 0))
 
-        text2 = font.render("Press space key to exit", 1, (255, 0, 0))
+        text2 = self._text_surfs['exit']
         text2_rect = text2.get_rect(center=(self.screen_width/2, text1_rect.bottom + 20))
-        text2_surface = pygame.Surface(text2.get_size())
-        text2_surface.fill((0, 0, 0))
 
         # Blit the image and texts
         self.screen.blit(win_image, win_image_rect)
-        self.screen.blit(text1_surface, text1_rect)
-        self.screen.blit(text2_surface, text2_rect)
+        pygame.draw.rect(self.screen, (0, 0, 0), text1_rect)
+        pygame.draw.rect(self.screen, (0, 0, 0), text2_rect)
         self.screen.blit(text1, text1_rect)
         self.screen.blit(text2, text2_rect)
 
@@ -395,11 +502,13 @@ class MemeTrain:
         Wait for a key press to exit the game, then return to the menu.
         """
         while True:
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        self.exit_to_menu()
-                        return
+            events = pygame.event.get(pygame.KEYDOWN)
+            pygame.event.clear(pump=False)
+            for event in events:
+                if event.key == pygame.K_SPACE:
+                    self.exit_to_menu()
+                    return
+            self.clock.tick(30)
     
     def move_snake(self):
         """
@@ -411,45 +520,40 @@ class MemeTrain:
         # Wrap the snake around the screen
         new_head = (new_head[0] % self.grid_width, new_head[1] % self.grid_height)
 
-        self.snake.insert(0, new_head)
+        # The old head now faces the new head, which faces the same way
+        angle = _DIR_TO_ANGLE[self.snake_direction]
+        self.snake_angles[0] = angle
+        self.snake_angles.appendleft(angle)
+        self.snake.appendleft(new_head)
+        ate_meme = self.meme_collision()
+        if not ate_meme:
+            self.snake_set.discard(self.snake.pop())
+            self.snake_angles.pop()
+        # The head can only hit the body once the tail has moved on
+        self.self_collision = new_head in self.snake_set
+        self.snake_set.add(new_head)
 
         # Check for collisions with meme
-        if self.meme_collision():
+        if ate_meme:
             # Add to the snake
-            self.snake_images.append(
-                pygame.transform.scale(
-                    pygame.image.load(os.path.join(ASSETS_PATH, 'cars', f'{self.meme.team}.png')),
-                    (20, 50)
-                )
-            )
-            self.teams_collected.append(self.meme.team)
+            self.snake_images.append(self.car_surfaces[self.meme.team])
+            self.team_counts[self.meme.team] += 1
             # Check if two memes for every team have been collected
-            if set(self.teams_collected) == set(TEAMS.values()):
-                if all([x >= 2 for x in Counter(self.teams_collected).values()]):
-                    return self.win()
+            if (
+                len(self.team_counts) == len(self._all_teams)
+                and min(self.team_counts.values()) >= 2
+            ):
+                return self.win()
 
             # Add a new meme
-            x, y = self.random_grid_position()
-            while (
-                x == self.snake[0][0] and y == self.snake[0][1]
-            ) & (
-                self.meme.meme_box.intersects(Point((x * GRID_SIZE, y * GRID_SIZE)))
-            ):
-                x, y = self.random_grid_position()
-            self.meme = Meme(
-                x=x,
-                y=y,
-                width=MEME_WIDTH,
-                exclude_image=self.meme.meme_image
-            )
+            self.meme = Meme(width=MEME_WIDTH, exclude_image=self.meme.meme_image)
+            self.meme.place(*self.random_free_grid_position(self.meme.cols, self.meme.rows))
             self.super_max = self.meme.driver_name == 'verstappen'
             if self.super_max:
                 self.play_super_max()
             else:
                 self.stop_super_max()
                 self.run_meme_sound()
-        else:
-            self.snake.pop()
         self.snake_collision()
 
     def run_meme_sound(self):
@@ -458,26 +562,17 @@ class MemeTrain:
         """
         if self.meme_sound is not None:
             self.meme_sound.stop()
-        if f'{self.meme.driver_name}.mp3' in os.listdir(os.path.join(ASSETS_PATH, 'sound')):
-            self.meme_sound = pygame.mixer.Sound(os.path.join(ASSETS_PATH, 'sound', f'{self.meme.driver_name}.mp3'))
-        else:
-            self.meme_sound = pygame.mixer.Sound(os.path.join(ASSETS_PATH, 'sound', 'f1-radio.mp3'))
+        driver_name = self.meme.driver_name
+        sound = self.meme_sounds.get(driver_name)
+        if sound is None:
+            if f'{driver_name}.mp3' in _SOUND_FILES:
+                sound = pygame.mixer.Sound(os.path.join(SOUND_DIR, f'{driver_name}.mp3'))
+            else:
+                sound = self.radio_sound
+            self.meme_sounds[driver_name] = sound
+        self.meme_sound = sound
         self.meme_sound.play()
 
-    def get_segment_direction(self, current_segment, next_segment):
-        """
-        Get the direction of a segment using the current and next segment.
-        """
-        # Determine the direction based on the position of the next segment
-        if next_segment[0] > current_segment[0]:
-            return 'right'
-        elif next_segment[0] < current_segment[0]:
-            return 'left'
-        elif next_segment[1] > current_segment[1]:
-            return 'down'
-        elif next_segment[1] < current_segment[1]:
-            return 'up'
-        
     def play_super_max(self):
         """
         Play the super max sound.
@@ -497,43 +592,45 @@ class MemeTrain:
         """
         Draw all the objects on the screen.
         """
-        if self.super_max:
-            screen_size = self.screen.get_size()
-            background_image = pygame.image.load(os.path.join(ASSETS_PATH, 'Netherlands.png'))
-            background_image = pygame.transform.scale(background_image, screen_size)
-            self.screen.blit(background_image, (0, 0))
+        # Redraw the whole background when it changes, otherwise only
+        # clear the areas covered by the previous frame
+        full_redraw = self._drawn_super_max != self.super_max
+        if full_redraw:
+            if self.super_max:
+                self.screen.blit(self.background_image, (0, 0))
+            else:
+                self.screen.fill((0,0,0))
         else:
-            self.screen.fill((0,0,0))
+            for prev_rect in self._prev_rects:
+                if self.super_max:
+                    self.screen.blit(self.background_image, prev_rect, prev_rect)
+                else:
+                    self.screen.fill((0,0,0), prev_rect)
 
         # Draw the meme
-        rect = self.meme.image.get_rect()
-        rect.topleft = self.meme.position
-        self.screen.blit(self.meme.image, rect)
+        new_rects = [self.screen.blit(self.meme.image, self.meme.rect)]
 
         # Draw the snake
-        for i, segment in enumerate(self.snake):
-            direction = None
-            image = self.snake_images[i]
+        segments = zip(self.snake_images, self.snake, self.snake_angles)
+        for i, (image, segment, angle) in enumerate(segments):
             if i == 0:
                 # Use the current direction for the head
                 angle = self.get_snake_head_rotation()
-            else:
-                # Determine the direction of the segment
-                direction = self.get_segment_direction(segment, self.snake[i - 1])
-                angle = {'up': 0, 'down': 180, 'left': 90, 'right': 270}.get(direction, 0)
-            
-            # Rotate the image based on the direction
-            rotated_image = pygame.transform.rotate(image, angle)
 
-            # Get the new size of the rotated image
-            image_rect = rotated_image.get_rect()
+            # Look up the pre-rotated image for the direction
+            rotated_image, (offset_x, offset_y) = self.car_rotations[image][angle]
 
             # Calculate the position of the segment
-            segment_x = segment[0] * GRID_SIZE + (GRID_SIZE - image_rect.width) // 2
-            segment_y = segment[1] * GRID_SIZE + (GRID_SIZE - image_rect.height) // 2
-            self.screen.blit(rotated_image, (segment_x, segment_y))
-        
-        pygame.display.update()
+            segment_x = segment[0] * GRID_SIZE + offset_x
+            segment_y = segment[1] * GRID_SIZE + offset_y
+            new_rects.append(self.screen.blit(rotated_image, (segment_x, segment_y)))
+
+        if full_redraw:
+            pygame.display.update()
+        else:
+            pygame.display.update(self._prev_rects + new_rects)
+        self._prev_rects = new_rects
+        self._drawn_super_max = self.super_max
 
     def main_loop(self):
         """